@@ -1,16 +1,40 @@
 """The NECTOR200 integration."""
 import logging
+import voluptuous as vol
+
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, ServiceCall
+import homeassistant.helpers.config_validation as cv
 
-from .const import DOMAIN
+from .const import (
+    ATTR_DIRECTORY,
+    ATTR_END,
+    ATTR_ENTRY_ID,
+    ATTR_MAX_TEMPERATURE,
+    ATTR_MIN_TEMPERATURE,
+    ATTR_START,
+    DOMAIN,
+    SERVICE_EXPORT_REPORT,
+)
 from .coordinator import NECTOR200Coordinator
+from .report import async_export_report
 
 _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS = [Platform.SENSOR, Platform.CLIMATE, Platform.SWITCH]
 
+SERVICE_EXPORT_REPORT_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_START): cv.datetime,
+        vol.Optional(ATTR_END): cv.datetime,
+        vol.Optional(ATTR_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_DIRECTORY): cv.string,
+        vol.Optional(ATTR_MIN_TEMPERATURE): vol.Coerce(float),
+        vol.Optional(ATTR_MAX_TEMPERATURE): vol.Coerce(float),
+    }
+)
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up NECTOR200 from a config entry."""
@@ -22,6 +46,18 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     
+    if not hass.services.has_service(DOMAIN, SERVICE_EXPORT_REPORT):
+        async def handle_export_report(call: ServiceCall) -> None:
+            """Export HACCP reports from the recorder history."""
+            await async_export_report(hass, call)
+        
+        hass.services.async_register(
+            DOMAIN,
+            SERVICE_EXPORT_REPORT,
+            handle_export_report,
+            schema=SERVICE_EXPORT_REPORT_SCHEMA,
+        )
+    
     return True
 
 
@@ -30,4 +66,6 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
         coordinator = hass.data[DOMAIN].pop(entry.entry_id)
         await coordinator.async_close()
+        if not hass.data[DOMAIN]:
+            hass.services.async_remove(DOMAIN, SERVICE_EXPORT_REPORT)
     return unload_ok
\ No newline at end of file
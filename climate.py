@@ -69,8 +69,7 @@ class NECTOR200Climate(CoordinatorEntity, ClimateEntity):
         success = await self.coordinator.async_set_temperature(temperature)
         
         if success:
-            # Update the local data optimistically
-            self.coordinator.data["setpoint"] = temperature
+            # The coordinator updates its cached setpoint with the value written
             self.async_write_ha_state()
             # Then request a refresh to get the actual value
             await self.coordinator.async_request_refresh()
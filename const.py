@@ -31,4 +31,20 @@ PARAM_OP_MODIFY = "mod"
 
 # Authentication
 DEFAULT_USERNAME = "admin"
-SESSION_KEEPALIVE_INTERVAL = 90  # seconds (under 2 minute limit)
\ No newline at end of file
+SESSION_KEEPALIVE_INTERVAL = 90  # seconds (under 2 minute limit)
+
+# Parameter write governor (protects the controller's parameter storage)
+WRITE_RATE_LIMIT = 6  # writes allowed per WRITE_RATE_PERIOD
+WRITE_RATE_PERIOD = 60  # seconds to fully refill the write budget
+WRITE_COALESCE_WINDOW = 2.0  # seconds; writes inside the window merge into the last one
+
+# HACCP report export
+SERVICE_EXPORT_REPORT = "export_haccp_report"
+ATTR_ENTRY_ID = "entry_id"
+ATTR_START = "start"
+ATTR_END = "end"
+ATTR_DIRECTORY = "directory"
+ATTR_MIN_TEMPERATURE = "min_temperature"
+ATTR_MAX_TEMPERATURE = "max_temperature"
+REPORT_DIRECTORY = "nector200_reports"
+REPORT_CHUNK_HOURS = 24  # history is read and written one chunk at a time
@@ -5,17 +5,56 @@ from typing import Any, Dict, Optional
 import aiohttp
 import asyncio
 import json
+import time
 
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.const import CONF_HOST, CONF_PASSWORD, CONF_USERNAME
 
-from .const import DEFAULT_SCAN_INTERVAL, DOMAIN
+from .const import (
+    DEFAULT_SCAN_INTERVAL,
+    DOMAIN,
+    WRITE_COALESCE_WINDOW,
+    WRITE_RATE_LIMIT,
+    WRITE_RATE_PERIOD,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
 
+class WriteGovernor:
+    """Token bucket limiting parameter writes sent to the device."""
+
+    def __init__(self, rate_limit: int, period: float) -> None:
+        """Initialize with a budget of rate_limit writes per period."""
+        self.capacity = rate_limit
+        self.refill_rate = rate_limit / period
+        self.suppressed_writes = 0
+        self._tokens = float(rate_limit)
+        self._updated = time.monotonic()
+
+    def _refill(self) -> None:
+        """Add the tokens earned since the last update."""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.refill_rate)
+        self._updated = now
+
+    async def async_acquire(self) -> None:
+        """Wait until a write token is available and take it."""
+        while True:
+            self._refill()
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+            await asyncio.sleep((1 - self._tokens) / self.refill_rate)
+
+    def release(self) -> None:
+        """Give back a token that was taken for a write that was not sent."""
+        self._refill()
+        self._tokens = min(self.capacity, self._tokens + 1)
+
+
 class NECTOR200Coordinator(DataUpdateCoordinator):
     """Class to manage fetching NECTOR200 data."""
 
@@ -28,6 +67,11 @@ class NECTOR200Coordinator(DataUpdateCoordinator):
         self._auth_id: Optional[str] = None
         self._last_keepalive = None
         self._keepalive_task = None
+        self._governor = WriteGovernor(WRITE_RATE_LIMIT, WRITE_RATE_PERIOD)
+        self._pending_setpoint: Optional[float] = None
+        self._pending_write: Optional[asyncio.Future] = None
+        self._write_lock = asyncio.Lock()
+        self._flush_tasks = set()
         
         super().__init__(
             hass,
@@ -194,21 +238,80 @@ class NECTOR200Coordinator(DataUpdateCoordinator):
         """Toggle defrost."""
         return await self.async_toggle_button(2)
 
+    @property
+    def suppressed_writes(self) -> int:
+        """Return the number of parameter writes skipped or merged by the governor."""
+        return self._governor.suppressed_writes
+
+    def _is_current_setpoint(self, temperature: float) -> bool:
+        """Return True if the cached setpoint already matches temperature."""
+        # Compare at the device's 0.1 °C resolution; float differences of a
+        # single step can land just under 0.1
+        return round(temperature, 1) == round(self.data.get("setpoint", 0), 1)
+
     async def async_set_temperature(self, temperature: float) -> bool:
-        """Set target temperature (setpoint)."""
+        """Set target temperature (setpoint).
+
+        Writes are governed: no-op writes are skipped, writes arriving within
+        WRITE_COALESCE_WINDOW are merged into the last one and the device only
+        receives WRITE_RATE_LIMIT writes per WRITE_RATE_PERIOD.
+        """
+        if self._pending_write is None:
+            # While a write is in flight the cache is stale, so queue the value
+            # and let the flush decide under the lock
+            if not self._write_lock.locked() and self._is_current_setpoint(temperature):
+                self._governor.suppressed_writes += 1
+                return True
+            self._pending_write = self.hass.loop.create_future()
+            flush_task = self.hass.async_create_task(self._async_flush_setpoint())
+            self._flush_tasks.add(flush_task)
+            flush_task.add_done_callback(self._flush_tasks.discard)
+        else:
+            # Superseded by this call; only the last value reaches the device
+            self._governor.suppressed_writes += 1
+        
+        self._pending_setpoint = temperature
+        return await asyncio.shield(self._pending_write)
+
+    async def _async_flush_setpoint(self) -> None:
+        """Send the last queued setpoint once the window and rate limit allow."""
+        future = self._pending_write
+        result = False
+        try:
+            await asyncio.sleep(WRITE_COALESCE_WINDOW)
+            # One write in flight per device: the increment sent to the device
+            # must be computed after the previous write has updated the cache
+            async with self._write_lock:
+                await self._governor.async_acquire()
+                
+                # Calls arriving from now on start a new window
+                temperature = self._pending_setpoint
+                self._pending_write = None
+                self._pending_setpoint = None
+                
+                if self._is_current_setpoint(temperature):
+                    self._governor.release()
+                    self._governor.suppressed_writes += 1
+                    result = True
+                else:
+                    result = await self._async_write_setpoint(temperature)
+        finally:
+            if self._pending_write is future:
+                self._pending_write = None
+                self._pending_setpoint = None
+            if not future.done():
+                future.set_result(result)
+
+    async def _async_write_setpoint(self, temperature: float) -> bool:
+        """Write the setpoint to the device."""
         try:
             if not self._auth_id:
                 await self._authenticate()
             
-            # First, we need to get the current setpoint to calculate the difference
+            # The API uses incremental changes relative to the current setpoint
             current_setpoint = self.data.get("setpoint", 0)
             difference = temperature - current_setpoint
             
-            if abs(difference) < 0.1:  # Already at target
-                return True
-            
-            # The API uses incremental changes
-            # We need to find the setpoint parameter indices
             # Based on the manual, setpoint is at level 0, line 0
             url = f"http://{self.ip}/pdatamod.cgi"
             params = {
@@ -223,7 +326,10 @@ class NECTOR200Coordinator(DataUpdateCoordinator):
                 response.raise_for_status()
                 data = await response.json()
                 _LOGGER.debug("Set temperature response: %s", data)
-                return True
+            
+            # Keep the cache in step so the next increment is computed correctly
+            self.data["setpoint"] = temperature
+            return True
                 
         except Exception as err:
             _LOGGER.error("Failed to set temperature: %s", err)
@@ -233,6 +339,10 @@ class NECTOR200Coordinator(DataUpdateCoordinator):
         """Close the session and cancel tasks."""
         if self._keepalive_task:
             self._keepalive_task.cancel()
+        for flush_task in self._flush_tasks:
+            flush_task.cancel()
+        if self._flush_tasks:
+            await asyncio.gather(*self._flush_tasks, return_exceptions=True)
         await self.session.close()
 
     async def async_set_parameter(self, param: str, value: str) -> bool:
@@ -0,0 +1,361 @@
+"""HACCP report export for NECTOR200."""
+import csv
+import logging
+import os
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import or_
+
+from homeassistant.components.recorder import get_instance, history
+from homeassistant.components.recorder.db_schema import RecorderRuns
+from homeassistant.components.recorder.models import process_timestamp
+from homeassistant.components.recorder.util import session_scope
+from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import entity_registry as er
+from homeassistant.util import dt as dt_util, slugify
+
+from .const import (
+    ATTR_DIRECTORY,
+    ATTR_END,
+    ATTR_ENTRY_ID,
+    ATTR_MAX_TEMPERATURE,
+    ATTR_MIN_TEMPERATURE,
+    ATTR_START,
+    DOMAIN,
+    REPORT_CHUNK_HOURS,
+    REPORT_DIRECTORY,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Report columns, named after the sensor unique_id suffix they are read from
+REPORT_COLUMNS = ("temperature", "setpoint", "alarm")
+
+
+class ReportSummary:
+    """Track gaps and excursions while the history is streamed."""
+
+    def __init__(
+        self,
+        start: datetime,
+        min_temp: Optional[float],
+        max_temp: Optional[float],
+        downtime: List[Tuple[datetime, datetime]],
+    ) -> None:
+        """Initialize the summary."""
+        self.min_temp = min_temp
+        self.max_temp = max_temp
+        self.events: List[Dict[str, Any]] = []
+        self.samples = 0
+        self.lowest: Optional[float] = None
+        self.highest: Optional[float] = None
+        # Nothing is recorded until the first reading arrives
+        self._gap_start: Optional[datetime] = start
+        self._downtime = list(downtime)
+        self._excursion: Optional[Dict[str, Any]] = None
+        self._alarm_start: Optional[datetime] = None
+
+    def add_temperature(self, when: datetime, state: str) -> None:
+        """Process a temperature state.
+
+        The recorder only stores changes, so a steady temperature is not a gap;
+        gaps are the periods the sensor is unavailable or unknown, or nothing
+        was recorded at all.
+        """
+        self._advance(when)
+        try:
+            value = float(state)
+        except ValueError:
+            if self._gap_start is None:
+                self._gap_start = when
+            if self._excursion is not None:
+                self._close_excursion(when)
+            return
+
+        if self._gap_start is not None:
+            self._close_gap(when)
+
+        self.samples += 1
+        self.lowest = value if self.lowest is None else min(self.lowest, value)
+        self.highest = value if self.highest is None else max(self.highest, value)
+
+        outside = (self.max_temp is not None and value > self.max_temp) or (
+            self.min_temp is not None and value < self.min_temp
+        )
+        if outside:
+            if self._excursion is None:
+                self._excursion = {"start": when, "peak": value}
+            elif abs(value - self._limit_for(value)) > abs(
+                self._excursion["peak"] - self._limit_for(self._excursion["peak"])
+            ):
+                self._excursion["peak"] = value
+        elif self._excursion is not None:
+            self._close_excursion(when)
+
+    def add_alarm(self, when: datetime, state: str) -> None:
+        """Process an alarm state."""
+        self._advance(when)
+        if state == "On" and self._alarm_start is None:
+            self._alarm_start = when
+        elif state != "On" and self._alarm_start is not None:
+            self._add_event("alarm", self._alarm_start, when)
+            self._alarm_start = None
+
+    def finish(self, end: datetime) -> None:
+        """Close any open intervals at the end of the report period."""
+        self._advance(end)
+        if self._gap_start is not None:
+            self._close_gap(end)
+        if self._excursion is not None:
+            self._close_excursion(end)
+        if self._alarm_start is not None:
+            self._add_event("alarm", self._alarm_start, end)
+            self._alarm_start = None
+
+    def _advance(self, when: datetime) -> None:
+        """Record the recorder downtime that started before when."""
+        while self._downtime and self._downtime[0][0] <= when:
+            down_start, down_end = self._downtime.pop(0)
+            if self._excursion is not None:
+                self._close_excursion(down_start)
+            # Downtime inside an open sensor gap is already covered by it
+            if self._gap_start is None:
+                self._add_event("gap", down_start, down_end)
+
+    def _limit_for(self, value: float) -> float:
+        """Return the limit a value outside the range was compared against."""
+        if self.max_temp is not None and value > self.max_temp:
+            return self.max_temp
+        return self.min_temp
+
+    def _close_gap(self, end: datetime) -> None:
+        """Record the open gap."""
+        if end > self._gap_start:
+            self._add_event("gap", self._gap_start, end)
+        self._gap_start = None
+
+    def _close_excursion(self, end: datetime) -> None:
+        """Record the open excursion."""
+        self._add_event("excursion", self._excursion["start"], end, self._excursion["peak"])
+        self._excursion = None
+
+    def _add_event(
+        self, kind: str, start: datetime, end: datetime, peak: Optional[float] = None
+    ) -> None:
+        """Record a summary event."""
+        self.events.append({"type": kind, "start": start, "end": end, "peak": peak})
+
+    def write(self, path: str) -> None:
+        """Write the summary CSV."""
+        with open(path, "w", newline="", encoding="utf-8") as file:
+            writer = csv.writer(file)
+            writer.writerow(["type", "start", "end", "duration_s", "peak"])
+            for event in sorted(self.events, key=lambda event: event["start"]):
+                writer.writerow([
+                    event["type"],
+                    _format_time(event["start"]),
+                    _format_time(event["end"]),
+                    int((event["end"] - event["start"]).total_seconds()),
+                    "" if event["peak"] is None else event["peak"],
+                ])
+            writer.writerow([])
+            writer.writerow(["samples", self.samples])
+            writer.writerow(["lowest", "" if self.lowest is None else self.lowest])
+            writer.writerow(["highest", "" if self.highest is None else self.highest])
+            for kind in ("gap", "excursion", "alarm"):
+                writer.writerow(
+                    [f"{kind}s", sum(1 for event in self.events if event["type"] == kind)]
+                )
+
+
+def _format_time(when: datetime) -> str:
+    """Format a timestamp for the report in local time."""
+    return dt_util.as_local(when).isoformat(timespec="seconds")
+
+
+def _recorder_downtime(
+    hass: HomeAssistant, start: datetime, end: datetime
+) -> List[Tuple[datetime, datetime]]:
+    """Return the periods between start and end not covered by a recorder run."""
+    with session_scope(hass=hass) as session:
+        runs = (
+            session.query(RecorderRuns.start, RecorderRuns.end)
+            .filter(RecorderRuns.start < end)
+            .filter(or_(RecorderRuns.end.is_(None), RecorderRuns.end > start))
+            .order_by(RecorderRuns.start)
+            .all()
+        )
+
+    downtime = []
+    covered = start
+    for run_start, run_end in runs:
+        run_start = process_timestamp(run_start)
+        # The current run has no end yet
+        run_end = process_timestamp(run_end) if run_end else end
+        if run_start > covered:
+            downtime.append((covered, min(run_start, end)))
+        covered = max(covered, run_end)
+    if covered < end:
+        downtime.append((covered, end))
+    return downtime
+
+
+def export_report(
+    hass: HomeAssistant,
+    entity_ids: Dict[str, str],
+    path: str,
+    start: datetime,
+    end: datetime,
+    min_temp: Optional[float],
+    max_temp: Optional[float],
+) -> ReportSummary:
+    """Stream the history of one device to CSV; runs in the recorder executor.
+
+    History is read one REPORT_CHUNK_HOURS chunk at a time and written
+    straight to disk, so memory use does not grow with the report period.
+    A row is written whenever one of the columns changes. Both files are
+    written to a .part file first and renamed once complete.
+    """
+    columns = {entity_id: column for column, entity_id in entity_ids.items()}
+    values = {column: "" for column in REPORT_COLUMNS}
+    summary = ReportSummary(
+        start, min_temp, max_temp, _recorder_downtime(hass, start, end)
+    )
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    part_path = f"{path}.part"
+    summary_path = f"{os.path.splitext(path)[0]}_summary.csv"
+    summary_part_path = f"{summary_path}.part"
+    try:
+        _write_report(hass, columns, values, summary, part_path, start, end)
+        summary.finish(end)
+        summary.write(summary_part_path)
+    except Exception:
+        for leftover in (part_path, summary_part_path):
+            if os.path.exists(leftover):
+                os.remove(leftover)
+        raise
+
+    os.replace(part_path, path)
+    os.replace(summary_part_path, summary_path)
+    return summary
+
+
+def _write_report(
+    hass: HomeAssistant,
+    columns: Dict[str, str],
+    values: Dict[str, str],
+    summary: ReportSummary,
+    part_path: str,
+    start: datetime,
+    end: datetime,
+) -> None:
+    """Stream the history rows of one device to part_path."""
+    chunk = timedelta(hours=REPORT_CHUNK_HOURS)
+    cursor = start
+
+    with open(part_path, "w", newline="", encoding="utf-8") as file:
+        writer = csv.writer(file)
+        writer.writerow(["timestamp", *REPORT_COLUMNS])
+
+        chunk_start = start
+        while chunk_start < end:
+            chunk_end = min(chunk_start + chunk, end)
+            # The start state of each chunk also picks up changes that fall
+            # exactly on the chunk boundary
+            states = history.get_significant_states(
+                hass,
+                chunk_start,
+                chunk_end,
+                list(columns),
+                include_start_time_state=True,
+                significant_changes_only=False,
+                no_attributes=True,
+            )
+            changes = sorted(
+                (
+                    (max(state.last_updated, chunk_start), columns[entity_id], state.state)
+                    for entity_id, entity_states in states.items()
+                    for state in entity_states
+                ),
+                key=lambda change: change[0],
+            )
+
+            for when, column, state in changes:
+                if when < cursor or values[column] == state:
+                    continue
+                # Changes sharing a timestamp end up on the same row
+                if when != cursor and any(values.values()):
+                    writer.writerow([_format_time(cursor), *values.values()])
+                cursor = when
+                values[column] = state
+                if column == "temperature":
+                    summary.add_temperature(when, state)
+                elif column == "alarm":
+                    summary.add_alarm(when, state)
+
+            chunk_start = chunk_end
+
+        if any(values.values()):
+            writer.writerow([_format_time(cursor), *values.values()])
+
+
+async def async_export_report(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Handle the export_haccp_report service."""
+    start = dt_util.as_utc(call.data[ATTR_START])
+    end = dt_util.as_utc(call.data.get(ATTR_END) or dt_util.utcnow())
+    if start >= end:
+        raise HomeAssistantError("Report start must be before its end")
+
+    min_temp = call.data.get(ATTR_MIN_TEMPERATURE)
+    max_temp = call.data.get(ATTR_MAX_TEMPERATURE)
+    if min_temp is not None and max_temp is not None and min_temp > max_temp:
+        raise HomeAssistantError("Report min_temperature must not exceed max_temperature")
+
+    # The default directory belongs to the integration; only a user supplied
+    # directory has to be in allowlist_external_dirs
+    if directory := call.data.get(ATTR_DIRECTORY):
+        if not hass.config.is_allowed_path(directory):
+            raise HomeAssistantError(f"Cannot write reports to {directory}: path is not allowed")
+    else:
+        directory = hass.config.path(REPORT_DIRECTORY)
+
+    entries = hass.config_entries.async_entries(DOMAIN)
+    if entry_id := call.data.get(ATTR_ENTRY_ID):
+        entries = [entry for entry in entries if entry.entry_id == entry_id]
+        if not entries:
+            raise HomeAssistantError(f"No NECTOR200 device with entry ID {entry_id}")
+
+    registry = er.async_get(hass)
+    for entry in entries:
+        entity_ids = {}
+        for column in REPORT_COLUMNS:
+            entity_id = registry.async_get_entity_id(
+                "sensor", DOMAIN, f"{entry.entry_id}_{column}"
+            )
+            if entity_id:
+                entity_ids[column] = entity_id
+        if "temperature" not in entity_ids:
+            _LOGGER.warning("Skipping report for %s: no temperature sensor", entry.title)
+            continue
+
+        path = os.path.join(
+            directory,
+            f"{slugify(entry.title)}_{start:%Y%m%d}_{end:%Y%m%d}.csv",
+        )
+        summary = await get_instance(hass).async_add_executor_job(
+            export_report,
+            hass,
+            entity_ids,
+            path,
+            start,
+            end,
+            min_temp,
+            max_temp,
+        )
+        _LOGGER.info(
+            "Exported HACCP report for %s to %s (%s samples, %s events)",
+            entry.title, path, summary.samples, len(summary.events),
+        )
@@ -7,7 +7,7 @@ from homeassistant.components.sensor import (
     SensorEntity,
     SensorStateClass,
 )
-from homeassistant.const import UnitOfTemperature
+from homeassistant.const import EntityCategory, UnitOfTemperature
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
@@ -30,6 +30,7 @@ async def async_setup_entry(
         NECTOR200SetpointSensor(coordinator, config_entry),
         NECTOR200StatusSensor(coordinator, config_entry, "alarm", "Alarm"),
         NECTOR200StatusSensor(coordinator, config_entry, "recording", "Recording"),
+        NECTOR200SuppressedWritesSensor(coordinator, config_entry),
     ]
     
     async_add_entities(entities)
@@ -86,4 +87,22 @@ class NECTOR200StatusSensor(CoordinatorEntity, SensorEntity):
     @property
     def native_value(self) -> str:
         """Return the state of the sensor."""
-        return "On" if self.coordinator.data.get(self._sensor_type) else "Off"
\ No newline at end of file
+        return "On" if self.coordinator.data.get(self._sensor_type) else "Off"
+
+
+class NECTOR200SuppressedWritesSensor(CoordinatorEntity, SensorEntity):
+    """Count of parameter writes skipped or merged by the write governor."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+
+    def __init__(self, coordinator, config_entry):
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._attr_unique_id = f"{config_entry.entry_id}_suppressed_writes"
+        self._attr_name = "WH1 Suppressed Writes"
+
+    @property
+    def native_value(self) -> int:
+        """Return the state of the sensor."""
+        return self.coordinator.suppressed_writes